@@ -14,27 +14,126 @@ Author: Data Processing Pipeline
 Date: 2025-11-25
 """
 
+import itertools
+import logging
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 import re
 
+from schema import DataSummary
+
+logger = logging.getLogger(__name__)
+
+
+# Rows per chunk when streaming the input dataset
+CHUNKSIZE = 50_000
+
+# Columns read from the exogenous variables dataset
+INPUT_COLUMNS = [
+    'ResponseId', 'Q179', 'Q4_4', 'Q80_1', 'Q256', 'Q190', 'Q191', 'Q120',
+    'Q4_2', 'Q4_3', 'Q4_5', 'Q82_1', 'Q83_1', 'Q84', 'Q219_3', 'Q219_4',
+    'Q243_1', 'Q243_2', 'Q243_3', 'Q243_9', 'Q211', 'Q86', 'Q87'
+]
+
+# Text columns are always read as strings so that every chunk is parsed the
+# same way (e.g. an all-missing text column in one chunk must not be inferred
+# as float); numeric columns are coerced with pd.to_numeric in clean_chunk
+TEXT_DTYPES = {
+    col: str
+    for col in ['ResponseId', 'Q179', 'Q256', 'Q190', 'Q191', 'Q84',
+                'Q219_3', 'Q219_4', 'Q211', 'Q86', 'Q87']
+}
+
+# Text variables stored as pandas categoricals (far smaller than Python strings)
+CATEGORICAL_COLUMNS = [
+    'gender',
+    'respondent_work_hours_cat',
+    'education_cat',
+    'health_status_cat',
+    'household_income_cat',
+    'personal_income_cat',
+    'vocational_qualification',
+    'lives_with_others'
+]
+
+# Small-range integer variables (counts, codes, ordinal scales) stored as
+# nullable Int8 so that missing values are preserved (see scan_integer_dtypes)
+INTEGER_COLUMNS = [
+    'num_children',
+    'num_partners',
+    'num_parents',
+    'num_siblings',
+    'gender_code',
+    'education_level',
+    'has_university_degree',
+    'health_status',
+    'personal_income_change',
+    'partner_income_change'
+]
+
+# Household composition counts and the input columns they are read from;
+# unlike the encoded variables their values are not fixed in advance
+HOUSEHOLD_COLUMNS = {
+    'num_children': 'Q4_4',
+    'num_partners': 'Q4_2',
+    'num_parents': 'Q4_3',
+    'num_siblings': 'Q4_5'
+}
+
+# Continuous variables stored in single precision
+FLOAT32_COLUMNS = [
+    'respondent_work_hours',
+    'age',
+    'height_cm',
+    'weight_kg',
+    'bmi',
+    'risk_tolerance',
+    'task_share_food',
+    'task_share_childcare',
+    'task_share_education',
+    'task_share_housework',
+    'household_income',
+    'personal_income'
+]
+
+# Run of digits (captured), used to parse risk tolerance and income ranges
+NUMBER_PATTERN = re.compile(r'(\d+)')
+
+# Vocational qualifications (Q191) that indicate a university degree
+UNIVERSITY_DEGREE_PATTERN = re.compile(
+    r'Universität|Hochschule|Bachelor|Master|Diplom|Promotion',
+    re.IGNORECASE
+)
+
+
+def map_via_categorical(series, mapping, dtype=np.float64):
+    """
+    Map values of a text column through a dictionary via categorical codes
+    Each distinct category is looked up once; unmapped values and missing
+    values become NaN (equivalent to series.map(mapping))
+    """
+    categorical = series.astype('category')
+    # Lookup table with one entry per category plus a trailing NaN,
+    # so that the missing-value code -1 maps to NaN
+    lookup = np.array(
+        [mapping.get(category, np.nan) for category in categorical.cat.categories] + [np.nan],
+        dtype=dtype
+    )
+    values = lookup[categorical.cat.codes.to_numpy()]
+    return pd.Series(values, index=series.index, name=series.name)
+
 
 def clean_risk_tolerance(series):
     """
     Clean Q84 (risk tolerance) - extract numeric values from mixed format
     Range: 0-10 where 0 = not willing to take risks, 10 = very willing
     """
-    def extract_number(val):
-        if pd.isna(val):
-            return np.nan
-        val_str = str(val)
-        # Extract first number from string
-        match = re.search(r'\d+', val_str)
-        if match:
-            return float(match.group())
-        return np.nan
-
-    return series.apply(extract_number)
+    # Extract first number from string (vectorized; missing/no match -> NaN)
+    numbers = series.astype('string').str.extract(NUMBER_PATTERN, expand=False)
+    return numbers.astype(float)
 
 
 def encode_respondent_work_hours(series):
@@ -52,7 +151,7 @@ def encode_respondent_work_hours(series):
         'Mehr als 50 Stunden': 55,
         'Nicht erwerbstätig': 0
     }
-    return series.map(mapping)
+    return map_via_categorical(series, mapping)
 
 
 def encode_gender(series):
@@ -64,7 +163,7 @@ def encode_gender(series):
         'Weiblich': 'Female',
         'Divers': 'Diverse'
     }
-    return series.map(mapping)
+    return map_via_categorical(series, mapping, dtype=object)
 
 
 def encode_education(series):
@@ -79,7 +178,7 @@ def encode_education(series):
         'Mittleren Schulabschluss (z.B. Realschulabschluss)': 3,
         'Abitur oder Fachabitur (Höchster Schulabschluss/ Hochschulreife)': 4
     }
-    return series.map(mapping)
+    return map_via_categorical(series, mapping)
 
 
 def encode_health_status(series):
@@ -94,7 +193,7 @@ def encode_health_status(series):
         'Gut': 4,
         'Sehr gut': 5
     }
-    return series.map(mapping)
+    return map_via_categorical(series, mapping)
 
 
 def encode_change_variables(series):
@@ -109,7 +208,7 @@ def encode_change_variables(series):
         'leicht zugenommen': 1,
         'stark zugenommen': 2
     }
-    return series.map(mapping)
+    return map_via_categorical(series, mapping)
 
 
 def parse_income_range(series):
@@ -117,251 +216,281 @@ def parse_income_range(series):
     Parse income ranges (Q86, Q87) and return midpoint in euros
     e.g., '1001-1500€' -> 1250.5
     """
-    def extract_midpoint(val):
-        if pd.isna(val):
-            return np.nan
-        val_str = str(val)
-        # Extract numbers from range like '1001-1500€'
-        numbers = re.findall(r'\d+', val_str)
-        if len(numbers) >= 2:
-            return (float(numbers[0]) + float(numbers[1])) / 2
-        elif len(numbers) == 1:
-            return float(numbers[0])
-        return np.nan
+    # Extract numbers from range like '1001-1500€' into one row per match,
+    # then spread the first two matches into columns (lower, upper bound)
+    numbers = series.astype('string').str.extractall(NUMBER_PATTERN)[0].astype(float)
+    wide = numbers.unstack('match').reindex(index=series.index, columns=[0, 1])
+    lower, upper = wide[0], wide[1]
 
-    return series.apply(extract_midpoint)
+    # Single number -> that number; no number or missing -> NaN
+    return lower.where(upper.isna(), (lower + upper) / 2).rename(series.name)
 
 
 def calculate_bmi(height_cm, weight_kg):
     """
     Calculate BMI from height (cm) and weight (kg)
     BMI = weight / (height_m)^2
+    Computed in float64 and returned as a float32 NumPy array
     """
-    height_m = height_cm / 100
-    bmi = weight_kg / (height_m ** 2)
-    return bmi
+    height_m = np.asarray(height_cm, dtype=np.float64) / 100
+    bmi = np.asarray(weight_kg, dtype=np.float64) / (height_m * height_m)
+    return bmi.astype(np.float32)
 
 
-def clean_exogenous_dataset(input_file, output_file, original_data_file='Data_Wave2 (1).csv'):
+def fits_int8(series):
     """
-    Main cleaning function - processes the entire dataset
+    Check that all non-missing values are whole numbers in the int8 range
     """
-    print("=" * 80)
-    print("DATA CLEANING PIPELINE")
-    print("=" * 80)
+    values = series.dropna()
+    return bool(((values % 1 == 0) & values.between(-128, 127)).all())
 
-    # Load data
-    print("\n1. Loading data...")
-    df = pd.read_csv(input_file)
-    print(f"   Loaded {df.shape[0]} observations, {df.shape[1]} variables")
 
-    # Load Q1 from original dataset to handle missing values properly
-    print("   Loading Q1 (living situation) from original dataset...")
-    df_original = pd.read_csv(original_data_file)
-    df_original_data = df_original.iloc[2:].reset_index(drop=True)
-    q1_data = df_original_data['Q1']
+def scan_integer_dtypes(input_file, chunksize=CHUNKSIZE):
+    """
+    Choose one dtype per integer variable for the whole dataset
+    The encoded variables always fit nullable Int8. The household counts use
+    Int8 unless any chunk has a fractional or out-of-range answer, in which
+    case the count is kept as float32 in every chunk
+    """
+    integer_dtypes = dict.fromkeys(INTEGER_COLUMNS, 'Int8')
+    with pd.read_csv(input_file, usecols=list(HOUSEHOLD_COLUMNS.values()),
+                     chunksize=chunksize) as reader:
+        for df in reader:
+            for col, source in HOUSEHOLD_COLUMNS.items():
+                if not fits_int8(pd.to_numeric(df[source], errors='coerce')):
+                    integer_dtypes[col] = 'float32'
+    return integer_dtypes
+
+
+def clean_chunk(df, q1_data, integer_dtypes, verbose=False):
+    """
+    Clean one chunk of the exogenous variables dataset (steps 2-13)
+    q1_data holds the Q1 answers for the same rows as df; integer_dtypes
+    maps each integer variable to its dtype (see scan_integer_dtypes)
+    """
+    def report(message):
+        if verbose:
+            logger.info(message)
 
     # Create cleaned dataframe
     df_clean = pd.DataFrame()
 
     # Keep ID
-    print("\n2. Preserving ID variable...")
+    report("\n2. Preserving ID variable...")
     df_clean['ResponseId'] = df['ResponseId']
 
     # Add living situation indicator
-    print("\n3. Adding living situation indicator (Q1)...")
+    report("\n3. Adding living situation indicator (Q1)...")
     df_clean['lives_with_others'] = q1_data.map({'Ja': 'Yes', 'Nein': 'No'})
 
     # Clean respondent work hours
-    print("\n4. Encoding respondent work hours (Q179)...")
+    report("\n4. Encoding respondent work hours (Q179)...")
     df_clean['respondent_work_hours'] = encode_respondent_work_hours(df['Q179'])
     df_clean['respondent_work_hours_cat'] = df['Q179']  # Keep original categories
 
     # Clean household composition
-    print("\n5. Processing household composition variables...")
-    df_clean['num_children'] = df['Q4_4']
-    df_clean['num_partners'] = df['Q4_2']
-    df_clean['num_parents'] = df['Q4_3']
-    df_clean['num_siblings'] = df['Q4_5']
+    report("\n5. Processing household composition variables...")
+    for col, source in HOUSEHOLD_COLUMNS.items():
+        df_clean[col] = pd.to_numeric(df[source], errors='coerce', downcast='float')
 
     # Fix missing values for people living alone
-    print("   Fixing missing values: People living alone have 0 household members...")
+    report("   Fixing missing values: People living alone have 0 household members...")
     lives_alone = q1_data == 'Nein'
-    df_clean.loc[lives_alone, 'num_children'] = df_clean.loc[lives_alone, 'num_children'].fillna(0)
-    df_clean.loc[lives_alone, 'num_partners'] = df_clean.loc[lives_alone, 'num_partners'].fillna(0)
-    df_clean.loc[lives_alone, 'num_parents'] = df_clean.loc[lives_alone, 'num_parents'].fillna(0)
-    df_clean.loc[lives_alone, 'num_siblings'] = df_clean.loc[lives_alone, 'num_siblings'].fillna(0)
-
-    before_fix = df['Q4_4'].isnull().sum()
-    after_fix = df_clean['num_children'].isnull().sum()
-    print(f"   Missing values reduced: {before_fix} → {after_fix} ({after_fix/len(df_clean)*100:.1f}%)")
+    household_cols = list(HOUSEHOLD_COLUMNS)
+    df_clean.loc[lives_alone, household_cols] = df_clean.loc[lives_alone, household_cols].fillna(0)
 
     # Clean demographics
-    print("\n6. Processing demographic variables...")
-    df_clean['age'] = df['Q80_1']
+    report("\n6. Processing demographic variables...")
+    df_clean['age'] = pd.to_numeric(df['Q80_1'], errors='coerce', downcast='float')
     df_clean['gender'] = encode_gender(df['Q256'])
     df_clean['gender_code'] = df['Q256'].map({'Männlich': 1, 'Weiblich': 2, 'Divers': 3})
     df_clean['education_level'] = encode_education(df['Q190'])
     df_clean['education_cat'] = df['Q190']  # Keep original text
-    df_clean['zip_code'] = df['Q120']
+    # Fixed float64 so every chunk writes the codes in the same format
+    df_clean['zip_code'] = pd.to_numeric(df['Q120'], errors='coerce').astype('float64')
 
     # Clean vocational qualifications
-    print("\n7. Processing vocational qualifications (Q191)...")
+    report("\n7. Processing vocational qualifications (Q191)...")
     df_clean['vocational_qualification'] = df['Q191']
     # Create binary indicator for university degree
     df_clean['has_university_degree'] = df['Q191'].str.contains(
-        'Universität|Hochschule|Bachelor|Master|Diplom|Promotion',
-        case=False,
+        UNIVERSITY_DEGREE_PATTERN,
         na=False
-    ).astype(int)
+    ).astype('int8')
 
     # Clean physical characteristics
-    print("\n8. Processing physical characteristics...")
-    df_clean['height_cm'] = df['Q82_1']
-    df_clean['weight_kg'] = df['Q83_1']
-    df_clean['bmi'] = calculate_bmi(df['Q82_1'], df['Q83_1'])
+    report("\n8. Processing physical characteristics...")
+    df_clean['height_cm'] = pd.to_numeric(df['Q82_1'], errors='coerce', downcast='float')
+    df_clean['weight_kg'] = pd.to_numeric(df['Q83_1'], errors='coerce', downcast='float')
+    df_clean['bmi'] = pd.Series(calculate_bmi(df_clean['height_cm'], df_clean['weight_kg']), index=df.index)
 
     # Clean risk tolerance
-    print("\n9. Processing risk tolerance (Q84)...")
+    report("\n9. Processing risk tolerance (Q84)...")
     df_clean['risk_tolerance'] = clean_risk_tolerance(df['Q84'])
 
     # Clean work/income change variables
-    print("\n10. Processing work and income changes (Q219_3, Q219_4)...")
+    report("\n10. Processing work and income changes (Q219_3, Q219_4)...")
     df_clean['personal_income_change'] = encode_change_variables(df['Q219_3'])
     df_clean['partner_income_change'] = encode_change_variables(df['Q219_4'])
 
     # Clean household task division
-    print("\n11. Processing household task division (Q243_*)...")
-    df_clean['task_share_food'] = df['Q243_1']  # % share: food shopping & preparation
-    df_clean['task_share_childcare'] = df['Q243_2']  # % share: childcare
-    df_clean['task_share_education'] = df['Q243_3']  # % share: children's education
-    df_clean['task_share_housework'] = df['Q243_9']  # % share: housework
+    report("\n11. Processing household task division (Q243_*)...")
+    # % share: food shopping & preparation
+    df_clean['task_share_food'] = pd.to_numeric(df['Q243_1'], errors='coerce', downcast='float')
+    # % share: childcare
+    df_clean['task_share_childcare'] = pd.to_numeric(df['Q243_2'], errors='coerce', downcast='float')
+    # % share: children's education
+    df_clean['task_share_education'] = pd.to_numeric(df['Q243_3'], errors='coerce', downcast='float')
+    # % share: housework
+    df_clean['task_share_housework'] = pd.to_numeric(df['Q243_9'], errors='coerce', downcast='float')
 
     # Clean health status
-    print("\n12. Processing health status (Q211)...")
+    report("\n12. Processing health status (Q211)...")
     df_clean['health_status'] = encode_health_status(df['Q211'])
     df_clean['health_status_cat'] = df['Q211']  # Keep original text
 
     # Clean income variables
-    print("\n13. Processing income variables (Q86, Q87)...")
+    report("\n13. Processing income variables (Q86, Q87)...")
     df_clean['household_income'] = parse_income_range(df['Q86'])
     df_clean['personal_income'] = parse_income_range(df['Q87'])
     df_clean['household_income_cat'] = df['Q86']  # Keep original categories
     df_clean['personal_income_cat'] = df['Q87']  # Keep original categories
 
+    # Downcast numeric variables to the smallest suitable dtype
+    for col in INTEGER_COLUMNS:
+        df_clean[col] = df_clean[col].astype(integer_dtypes[col])
+    for col in FLOAT32_COLUMNS:
+        df_clean[col] = df_clean[col].astype('float32')
+
+    # Store text variables as categoricals
+    for col in CATEGORICAL_COLUMNS:
+        df_clean[col] = df_clean[col].astype('category')
+
+    return df_clean
+
+
+def parquet_schema(df_chunk):
+    """
+    Arrow schema for the Parquet copy, shared by all chunks
+    Each chunk has its own categories, so categoricals are written as
+    string dictionaries with a fixed int32 index type
+    """
+    schema = pa.Schema.from_pandas(df_chunk, preserve_index=False)
+    for col in CATEGORICAL_COLUMNS:
+        index = schema.get_field_index(col)
+        schema = schema.set(index, pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+    return schema
+
+
+def clean_exogenous_dataset(input_file, output_file, original_data_file='Data_Wave2 (1).csv',
+                            chunksize=CHUNKSIZE):
+    """
+    Main cleaning function - processes the entire dataset in chunks of rows
+    Cleaned chunks are appended to output_file and its Parquet copy as they
+    are processed; returns the DataSummary of the cleaned dataset
+    """
+    logger.info("=" * 80)
+    logger.info("DATA CLEANING PIPELINE")
+    logger.info("=" * 80)
+
+    # Load data
+    logger.info(f"\n1. Loading data in chunks of {chunksize} rows...")
+    # Fix the integer dtypes up front so that every chunk is written the same way
+    integer_dtypes = scan_integer_dtypes(input_file, chunksize)
+
+    # Load Q1 from original dataset to handle missing values properly
+    logger.info("   Loading Q1 (living situation) from original dataset in the same chunks...")
+    parquet_file = output_file.replace('.csv', '.parquet')
+    summary = DataSummary()
+    parquet_writer = None
+    n_chunks = 0
+    before_fix = 0
+    # Only parse the Q1 column and skip the two survey metadata rows below the header
+    with pd.read_csv(input_file, usecols=INPUT_COLUMNS, dtype=TEXT_DTYPES,
+                     chunksize=chunksize) as reader, \
+            pd.read_csv(original_data_file, usecols=['Q1'], skiprows=[1, 2],
+                        dtype='category', chunksize=chunksize) as q1_reader:
+        # Clean each chunk and append it to the output files; only the
+        # summary statistics are kept in memory
+        for df, q1_chunk in itertools.zip_longest(reader, q1_reader):
+            if df is None:
+                # Survey file has more rows than the input; extra Q1 answers are unused
+                break
+            # Align Q1 to the input rows; rows beyond the end of the survey file get NaN
+            if q1_chunk is None:
+                q1_data = pd.Series(index=df.index, dtype='category', name='Q1')
+            else:
+                q1_data = q1_chunk['Q1'].reindex(df.index)
+            first = n_chunks == 0
+            df_chunk = clean_chunk(df, q1_data, integer_dtypes, verbose=first)
+            df_chunk.to_csv(output_file, mode='w' if first else 'a', header=first, index=False)
+            # Parquet copy keeps the categorical and downcast dtypes
+            if first:
+                schema = parquet_schema(df_chunk)
+                parquet_writer = pq.ParquetWriter(parquet_file, schema, compression='zstd')
+            table = pa.Table.from_pandas(df_chunk, preserve_index=False).cast(schema)
+            parquet_writer.write_table(table)
+            summary.update(df_chunk)
+            n_chunks += 1
+            before_fix += df['Q4_4'].isnull().sum()
+    if parquet_writer is not None:
+        parquet_writer.close()
+
     # Save cleaned data
-    print(f"\n14. Saving cleaned data to {output_file}...")
-    df_clean.to_csv(output_file, index=False)
+    logger.info(f"\n14. Saved {summary.n_rows} observations to {output_file} ({n_chunks} chunk(s))")
 
     # Generate summary statistics
-    print("\n" + "=" * 80)
-    print("CLEANING SUMMARY")
-    print("=" * 80)
-    print(f"\nOriginal dataset: {df.shape}")
-    print(f"Cleaned dataset: {df_clean.shape}")
-    print(f"\nMissing values by variable:")
-    missing_pct = (df_clean.isnull().sum() / len(df_clean) * 100).round(1)
+    logger.info("\n" + "=" * 80)
+    logger.info("CLEANING SUMMARY")
+    logger.info("=" * 80)
+    logger.info(f"\nOriginal dataset: {(summary.n_rows, len(INPUT_COLUMNS))}")
+    logger.info(f"Cleaned dataset: {(summary.n_rows, len(summary.dtypes))}")
+    after_fix = summary.missing['num_children']
+    logger.info(f"\nHousehold composition missing values reduced: {before_fix} → {after_fix} "
+                f"({after_fix/summary.n_rows*100:.1f}%)")
+    logger.info(f"\nMissing values by variable:")
+    missing_pct = (summary.missing / summary.n_rows * 100).round(1)
     for var, pct in missing_pct.items():
         if pct > 0:
-            print(f"  {var:30s}: {pct:5.1f}%")
+            logger.info(f"  {var:30s}: {pct:5.1f}%")
 
     # Generate data dictionary
-    print("\n15. Generating data dictionary...")
-    generate_data_dictionary(df_clean, output_file.replace('.csv', '_dictionary.txt'))
+    logger.info("\n15. Generating data dictionary...")
+    generate_data_dictionary(summary, output_file.replace('.csv', '_dictionary.txt'))
 
-    print("\n" + "=" * 80)
-    print("CLEANING COMPLETE!")
-    print("=" * 80)
+    logger.info("\n" + "=" * 80)
+    logger.info("CLEANING COMPLETE!")
+    logger.info("=" * 80)
 
-    return df_clean
+    return summary
 
 
-def generate_data_dictionary(df, output_file):
+def generate_data_dictionary(summary, output_file):
     """
-    Generate a data dictionary documenting all variables
+    Generate a data dictionary documenting all variables from the summary
+    statistics accumulated while cleaning
     """
-    dictionary = []
-    dictionary.append("=" * 80)
-    dictionary.append("DATA DICTIONARY - Cleaned Exogenous Variables Dataset")
-    dictionary.append("=" * 80)
-    dictionary.append("")
-
-    var_descriptions = {
-        'ResponseId': 'Unique survey response identifier',
-        'lives_with_others': 'Lives with others in household (Yes/No)',
-        'respondent_work_hours': 'Respondent\'s weekly work hours (numeric midpoint)',
-        'respondent_work_hours_cat': 'Respondent\'s weekly work hours (categorical)',
-        'num_children': 'Number of children in household (0 if living alone)',
-        'num_partners': 'Number of partners in household (0 if living alone)',
-        'num_parents': 'Number of parents in household (0 if living alone)',
-        'num_siblings': 'Number of siblings in household (0 if living alone)',
-        'age': 'Respondent\'s age in years',
-        'gender': 'Gender (Male/Female/Diverse)',
-        'gender_code': 'Gender code (1=Male, 2=Female, 3=Diverse)',
-        'education_level': 'Education level (1=None to 4=Abitur)',
-        'education_cat': 'Education level (categorical, German)',
-        'zip_code': 'Zip code of residence',
-        'vocational_qualification': 'Vocational qualification (text)',
-        'has_university_degree': 'Has university degree (1=Yes, 0=No)',
-        'height_cm': 'Height in centimeters',
-        'weight_kg': 'Weight in kilograms',
-        'bmi': 'Body Mass Index (calculated)',
-        'risk_tolerance': 'Risk tolerance (0=not willing to 10=very willing)',
-        'personal_income_change': 'Personal income change (-2=strongly decreased to +2=strongly increased)',
-        'partner_income_change': 'Partner income change (-2=strongly decreased to +2=strongly increased)',
-        'task_share_food': 'Personal share of food shopping/preparation (%)',
-        'task_share_childcare': 'Personal share of childcare (%)',
-        'task_share_education': 'Personal share of children\'s education (%)',
-        'task_share_housework': 'Personal share of housework (%)',
-        'health_status': 'Health status (1=Poor to 5=Very good)',
-        'health_status_cat': 'Health status (categorical, German)',
-        'household_income': 'Monthly household net income (euros, midpoint)',
-        'personal_income': 'Monthly personal net income (euros, midpoint)',
-        'household_income_cat': 'Monthly household net income (categorical)',
-        'personal_income_cat': 'Monthly personal net income (categorical)'
-    }
+    summary.write_data_dictionary(output_file, 'Cleaned Exogenous Variables Dataset')
 
-    for col in df.columns:
-        dictionary.append(f"\n{col}")
-        dictionary.append("-" * 40)
-        dictionary.append(f"Description: {var_descriptions.get(col, 'No description')}")
-        dictionary.append(f"Type: {df[col].dtype}")
-        dictionary.append(f"Missing: {df[col].isnull().sum()} ({df[col].isnull().sum()/len(df)*100:.1f}%)")
-        dictionary.append(f"Non-missing: {df[col].notna().sum()}")
-
-        if df[col].dtype in ['int64', 'float64']:
-            dictionary.append(f"Mean: {df[col].mean():.2f}")
-            dictionary.append(f"Std: {df[col].std():.2f}")
-            dictionary.append(f"Min: {df[col].min()}")
-            dictionary.append(f"Max: {df[col].max()}")
-        elif df[col].dtype == 'object':
-            dictionary.append(f"Unique values: {df[col].nunique()}")
-            if df[col].nunique() <= 10:
-                dictionary.append("Value counts:")
-                for val, count in df[col].value_counts().items():
-                    dictionary.append(f"  {val}: {count}")
-        dictionary.append("")
-
-    # Save dictionary
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(dictionary))
-
-    print(f"   Data dictionary saved to {output_file}")
+    logger.info(f"   Data dictionary saved to {output_file}")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # File paths
     input_file = "exogenous_variables_dataset.csv"
     output_file = "exogenous_variables_cleaned.csv"
 
     # Run cleaning
-    df_cleaned = clean_exogenous_dataset(input_file, output_file)
+    summary = clean_exogenous_dataset(input_file, output_file)
 
     # Display first few rows
-    print("\nFirst 5 rows of cleaned data:")
-    print(df_cleaned.head())
-
-    print("\nCleaned data shape:", df_cleaned.shape)
-    print("\nCleaning complete! Files generated:")
-    print(f"  - {output_file}")
-    print(f"  - {output_file.replace('.csv', '_dictionary.txt')}")
+    logger.info("\nFirst 5 rows of cleaned data:")
+    logger.info(pd.read_csv(output_file, nrows=5))
+
+    logger.info(f"\nCleaned data shape: {(summary.n_rows, len(summary.dtypes))}")
+    logger.info("\nCleaning complete! Files generated:")
+    logger.info(f"  - {output_file}")
+    logger.info(f"  - {output_file.replace('.csv', '.parquet')}")
+    logger.info(f"  - {output_file.replace('.csv', '_dictionary.txt')}")
@@ -0,0 +1,176 @@
+"""
+Variable Schema
+Labor Market Participation Study - Wave 2
+
+Descriptions of all variables in the cleaned exogenous variables dataset
+and the regional variables added by the merge, and the data dictionary
+writer shared by clean_exogenous_data.py and merge_regional_data.py.
+
+Author: Data Processing Pipeline
+Date: 2025-11-25
+"""
+
+import io
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+
+# Read-only mapping of variable name -> description
+VAR_DESCRIPTIONS = MappingProxyType({
+    'ResponseId': 'Unique survey response identifier',
+    'lives_with_others': 'Lives with others in household (Yes/No)',
+    'respondent_work_hours': 'Respondent\'s weekly work hours (numeric midpoint)',
+    'respondent_work_hours_cat': 'Respondent\'s weekly work hours (categorical)',
+    'num_children': 'Number of children in household (0 if living alone)',
+    'num_partners': 'Number of partners in household (0 if living alone)',
+    'num_parents': 'Number of parents in household (0 if living alone)',
+    'num_siblings': 'Number of siblings in household (0 if living alone)',
+    'age': 'Respondent\'s age in years',
+    'gender': 'Gender (Male/Female/Diverse)',
+    'gender_code': 'Gender code (1=Male, 2=Female, 3=Diverse)',
+    'education_level': 'Education level (1=None to 4=Abitur)',
+    'education_cat': 'Education level (categorical, German)',
+    'zip_code': 'Zip code of residence',
+    'vocational_qualification': 'Vocational qualification (text)',
+    'has_university_degree': 'Has university degree (1=Yes, 0=No)',
+    'height_cm': 'Height in centimeters',
+    'weight_kg': 'Weight in kilograms',
+    'bmi': 'Body Mass Index (calculated)',
+    'risk_tolerance': 'Risk tolerance (0=not willing to 10=very willing)',
+    'personal_income_change': 'Personal income change (-2=strongly decreased to +2=strongly increased)',
+    'partner_income_change': 'Partner income change (-2=strongly decreased to +2=strongly increased)',
+    'task_share_food': 'Personal share of food shopping/preparation (%)',
+    'task_share_childcare': 'Personal share of childcare (%)',
+    'task_share_education': 'Personal share of children\'s education (%)',
+    'task_share_housework': 'Personal share of housework (%)',
+    'health_status': 'Health status (1=Poor to 5=Very good)',
+    'health_status_cat': 'Health status (categorical, German)',
+    'household_income': 'Monthly household net income (euros, midpoint)',
+    'personal_income': 'Monthly personal net income (euros, midpoint)',
+    'household_income_cat': 'Monthly household net income (categorical)',
+    'personal_income_cat': 'Monthly personal net income (categorical)',
+    'federal_state': 'Federal state (Bundesland) based on postal code',
+    'district': 'District/county (Kreis) based on postal code',
+    'is_city': 'City indicator (1=City, 0=Not city)',
+    'population_density': 'Population density (inhabitants per km²)',
+    'is_rural': 'Rural area indicator (1=Rural, 0=Not rural)',
+    'population': 'Total population in the region',
+    'is_metropolitan': 'Metropolitan area indicator (1=Metropolitan, 0=Not metropolitan)'
+})
+
+
+class DataSummary:
+    """
+    Summary statistics for a data dictionary, accumulated chunk by chunk
+    Only counts, moments, min/max and value counts are kept, never the rows
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.dtypes = None
+
+    def update(self, df):
+        """
+        Add the rows of df (one chunk with the same columns and dtypes)
+        """
+        if self.dtypes is None:
+            # Classify column dtypes once (text includes object, string and categorical)
+            self.dtypes = df.dtypes
+            self.numeric_cols = [
+                col for col, dtype in self.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)
+            ]
+            self.text_cols = [
+                col for col, dtype in self.dtypes.items()
+                if pd.api.types.is_object_dtype(dtype)
+                or pd.api.types.is_string_dtype(dtype)
+                or isinstance(dtype, pd.CategoricalDtype)
+            ]
+            self.missing = pd.Series(0, index=df.columns)
+            self.count = pd.Series(0, index=self.numeric_cols)
+            self.mean = pd.Series(0.0, index=self.numeric_cols)
+            self.m2 = pd.Series(0.0, index=self.numeric_cols)
+            self.minimum = pd.Series(np.nan, index=self.numeric_cols)
+            self.maximum = pd.Series(np.nan, index=self.numeric_cols)
+            self.value_counts = {col: pd.Series(dtype='int64') for col in self.text_cols}
+
+        self.n_rows += len(df)
+        self.missing += df.isnull().sum()
+
+        # Combine count, mean and sum of squared deviations with the chunk's
+        # (parallel variance algorithm), so std needs no second pass
+        numeric = df[self.numeric_cols]
+        count = numeric.count()
+        mean = numeric.mean().fillna(0)
+        m2 = (numeric.var(ddof=0) * count).fillna(0)
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean = (self.mean + delta * count / total).fillna(0)
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.minimum = pd.concat([self.minimum, numeric.min()], axis=1).min(axis=1)
+        self.maximum = pd.concat([self.maximum, numeric.max()], axis=1).max(axis=1)
+
+        for col in self.text_cols:
+            counts = pd.concat([self.value_counts[col], df[col].value_counts(sort=False)])
+            self.value_counts[col] = counts.groupby(level=0, sort=False).sum()
+
+    def write_data_dictionary(self, output_file, title):
+        """
+        Write a data dictionary documenting all variables
+        Numeric variables get mean/std/min/max, text variables the number of
+        unique values (and value counts for at most 10 unique values)
+        """
+        dictionary = io.StringIO()
+        print("=" * 80, file=dictionary)
+        print(f"DATA DICTIONARY - {title}", file=dictionary)
+        print("=" * 80, file=dictionary)
+        print(file=dictionary)
+
+        dtypes = self.dtypes
+        missing = self.missing
+        non_missing = self.n_rows - missing
+        std = np.sqrt(self.m2 / (self.count - 1))
+
+        def format_as_column_type(value, col):
+            # Min/max of all columns share one upcast dtype; show them in the column's own type
+            return 'nan' if pd.isna(value) else str(dtypes[col].type(value))
+
+        for col in dtypes.index:
+            print(f"\n{col}", file=dictionary)
+            print("-" * 40, file=dictionary)
+            print(f"Description: {VAR_DESCRIPTIONS.get(col, 'No description')}", file=dictionary)
+            print(f"Type: {dtypes[col]}", file=dictionary)
+            print(f"Missing: {missing[col]} ({missing[col]/self.n_rows*100:.1f}%)", file=dictionary)
+            print(f"Non-missing: {non_missing[col]}", file=dictionary)
+
+            if col in self.numeric_cols:
+                if non_missing[col] > 0:
+                    print(f"Mean: {self.mean[col]:.2f}", file=dictionary)
+                    print(f"Std: {std[col]:.2f}", file=dictionary)
+                    print(f"Min: {format_as_column_type(self.minimum[col], col)}", file=dictionary)
+                    print(f"Max: {format_as_column_type(self.maximum[col], col)}", file=dictionary)
+            elif col in self.text_cols:
+                # Most frequent first; categories that never occur are not counted
+                counts = self.value_counts[col]
+                counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+                print(f"Unique values: {len(counts)}", file=dictionary)
+                if len(counts) <= 10:
+                    print("Value counts:", file=dictionary)
+                    for val, count in counts.items():
+                        print(f"  {val}: {count}", file=dictionary)
+            print(file=dictionary)
+
+        # Save dictionary
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(dictionary.getvalue())
+
+
+def write_data_dictionary(df, output_file, title):
+    """
+    Write a data dictionary documenting all variables of df
+    """
+    summary = DataSummary()
+    summary.update(df)
+    summary.write_data_dictionary(output_file, title)